@@ -7,8 +7,8 @@ import os
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from vos.core.sys import Kernel
-from vos.shell.repl import shell_process
+from vos.core.sys import Kernel, BAR
+from vos.shell.repl import shell_process, load_history, save_history
 
 
 def main():
@@ -19,10 +19,11 @@ def main():
     1. Creates a new Kernel instance
     2. Spawns the initial shell with PID 0
     3. Runs the shell directly (blocking until exit)
+    4. Loads and saves command history around the shell session
     """
-    print("=" * 60)
+    print(BAR)
     print("Virtual Operating System (VOS) - Lab 3")
-    print("=" * 60)
+    print(BAR)
     print()
 
     # Create kernel
@@ -38,14 +39,17 @@ def main():
     shell_pcb = kernel.processes[shell_pid]
 
     # Execute the shell (this blocks until shell exits)
+    load_history()
     try:
         shell_pcb.prog(kernel, shell_pcb)
     except Exception as e:
         print(f"\nShell crashed: {e}")
+    finally:
+        save_history()
 
-    print("\n" + "=" * 60)
+    print("\n" + BAR)
     print("VOS Shutdown")
-    print("=" * 60)
+    print(BAR)
 
 
 if __name__ == "__main__":
@@ -1,8 +1,8 @@
 """process.py - PCB and State for cooperative scheduler."""
 
 from dataclasses import dataclass, field
-from enum import Enum, auto
-from typing import Callable, TYPE_CHECKING
+from enum import IntEnum, auto
+from typing import Any, Callable, Dict, Optional, TYPE_CHECKING
 from vos.core.vm import VM
 
 if TYPE_CHECKING:
@@ -12,8 +12,8 @@ else:
     PCB = 'PCB'
 
 
-class State(Enum):
-    """Five-state process model."""
+class State(IntEnum):
+    """Five-state process model (int-valued, NEW=1 .. TERMINATED=5)."""
     NEW = auto()
     READY = auto()
     RUNNING = auto()
@@ -21,19 +21,34 @@ class State(Enum):
     TERMINATED = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class PCB:
-    """Process Control Block with per-process VM."""
+    """
+    Process Control Block with per-process VM.
+
+    The VM is created lazily by get_vm(), so processes that never touch
+    memory do not pay for one.
+
+    Uses __slots__, so programs cannot attach ad-hoc attributes; keep
+    per-program variables in `local`.
+    """
     # Required
     pid: int
     state: State = State.NEW
-    vm: VM = field(default_factory=VM)
+    vm: Optional[VM] = None
     prog: Callable[[Kernel, PCB], None] = lambda k, p: None
 
-    # Optional (justified: statistics, debugging, future priority scheduling)
+    # Optional (justified: statistics, debugging, priority scheduling)
     cpu_time: int = 0
     name: str = ""
-    priority: int = 0
+    priority: int = 0  # 0..63, clamped by the scheduler
+    local: Dict[str, Any] = field(default_factory=dict)  # Program-private state
+
+    def get_vm(self) -> VM:
+        """Return this process's VM, creating it on first use."""
+        if self.vm is None:
+            self.vm = VM()
+        return self.vm
 
     def __repr__(self) -> str:
         name_str = f" ({self.name})" if self.name else ""
@@ -42,5 +57,6 @@ class PCB:
 
 # Round-Robin Usage:
 # States: NEW→READY→RUNNING↔WAITING, RUNNING→TERMINATED
-# Fields: pid (id), state (lifecycle), vm (isolation), prog (code),
-#         cpu_time (stats), name (debug), priority (future)
\ No newline at end of file
+# Fields: pid (id), state (lifecycle), vm (isolation, lazy), prog (code),
+#         cpu_time (stats), name (debug), priority (higher runs first),
+#         local (per-program variables, empty until first step)
\ No newline at end of file
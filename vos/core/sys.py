@@ -1,24 +1,79 @@
+import heapq
 import os
-from typing import Dict, Optional, Callable, Any, List, Tuple
+from collections import deque
+from typing import Deque, Dict, Optional, Callable, Any, List, Tuple
 from vos.core.process import PCB, State
 from vos.core.vm import VM
 
+MAX_PRIORITY = 63  # Priorities are 0..MAX_PRIORITY, higher runs first
+AGING_INTERVAL = 8  # Dispatch cycles between Scheduler.age() calls
+
+# Output separators
+BAR = "=" * 60
+PRINT_PS_RULE = "-" * 35  # Width of the print_ps table
+
+
+def _entry_is_dir(entry: os.DirEntry) -> bool:
+    """DirEntry.is_dir() that treats an unreadable entry as a file, like os.path.isdir."""
+    try:
+        return entry.is_dir()
+    except OSError:
+        return False
+
 
 class Scheduler:
-    """Simple FIFO scheduler interface."""
+    """
+    Priority scheduler using bitmap-indexed FIFO buckets.
+
+    Priority p lives in bucket MAX_PRIORITY - p, and bit i of the bitmap is
+    set iff bucket i is nonempty, so the lowest set bit (find-first-set)
+    is always the highest-priority ready process. add/next are O(1).
+
+    Aging: a PCB is queued at its static priority, and every AGING_INTERVAL
+    cycles the kernel calls age(), which promotes every queued PCB one
+    level by shifting the bucket list (bucket 1 merges into bucket 0).
+    A PCB's effective priority therefore rises with the time it has waited
+    since it was last queued, no PCB is ever rescanned or re-keyed, and it
+    drops back to its static priority once it runs. Order inside a bucket
+    stays FIFO, so equal priorities behave as plain round-robin.
+
+    Killed processes are not removed eagerly; they are skipped when they
+    reach the front of their bucket (lazy deletion).
+    """
 
     def __init__(self):
-        self.ready_queue: List[PCB] = []
+        self.buckets: List[Deque[PCB]] = [deque() for _ in range(MAX_PRIORITY + 1)]
+        self.bitmap: int = 0
 
     def add(self, pcb: PCB) -> None:
         """Add PCB to ready queue."""
         if pcb.state == State.READY:
-            self.ready_queue.append(pcb)
+            b = MAX_PRIORITY - min(max(pcb.priority, 0), MAX_PRIORITY)
+            self.buckets[b].append(pcb)
+            self.bitmap |= 1 << b
+
+    def age(self) -> None:
+        """Promote every queued PCB by one priority level."""
+        buckets = self.buckets
+        top = buckets[0]
+        top.extend(buckets[1])
+        self.buckets = [top] + buckets[2:] + [deque()]
+        self.bitmap = (self.bitmap >> 1) | (self.bitmap & 1)
+
+    def empty(self) -> bool:
+        """True if no process is queued (tombstones count as queued)."""
+        return not self.bitmap
 
     def next(self) -> Optional[PCB]:
-        """Get next ready process (FIFO)."""
-        if self.ready_queue:
-            return self.ready_queue.pop(0)
+        """Get next ready process (highest priority, FIFO within a priority)."""
+        while self.bitmap:
+            b = (self.bitmap & -self.bitmap).bit_length() - 1
+            bucket = self.buckets[b]
+            pcb = bucket.popleft()
+            if not bucket:
+                self.bitmap &= ~(1 << b)
+            if pcb.state != State.TERMINATED:
+                return pcb
         return None
 
 
@@ -39,16 +94,29 @@ class Kernel:
         self.running: Optional[PCB] = None
         self.next_pid = 0  # Start from 0 for initial shell
         self.clock = 0
-        self.cwd = os.getcwd()  # Current working directory
-
-    def spawn(self, prog: Callable[[Any, PCB], None], *args, name: str = "") -> int:
+        # Current working directory, kept as a root anchor (drive + separator
+        # on Windows) plus path components; cwd and cwd_name (for prompts)
+        # are derived from them on successful cd
+        drive, rest = os.path.splitdrive(os.path.abspath(os.getcwd()))
+        self.cwd_root = drive + os.sep
+        self.cwd_parts: List[str] = [p for p in rest.split(os.sep) if p]
+        self.cwd = os.path.join(self.cwd_root, *self.cwd_parts)
+        self.cwd_name = self.cwd_parts[-1] if self.cwd_parts else self.cwd_root
+        # Sleeping processes as (wake_clock, seq, pcb), earliest first
+        self.wait_heap: List[Tuple[int, int, PCB]] = []
+        self._wait_seq = 0
+
+    def spawn(self, prog: Callable[[Any, PCB], None], *args, name: str = "",
+              needs_vm: bool = False) -> int:
         """
         Create a new process.
 
         Args:
             prog: Process program function(kernel, pcb)
-            *args: Optional arguments (can be stored in PCB or handled by prog)
+            *args: Optional arguments, bound in a closure at spawn time and
+                passed positionally to prog on every step
             name: Optional process name for debugging
+            needs_vm: Allocate the VM up front instead of on first get_vm()
 
         Returns:
             PID of newly created process
@@ -56,25 +124,20 @@ class Kernel:
         pid = self.next_pid
         self.next_pid += 1
 
-        # Wrap program to handle arguments if provided
+        # Bind arguments once at spawn time (no wrapper needed without args)
         if args:
-            # Store args in a closure
             original_prog = prog
 
             def wrapped_prog(kernel, pcb):
-                # Check if we need to initialize args storage
-                if not hasattr(pcb, '_args_stored'):
-                    pcb._args = args
-                    pcb._args_stored = True
-                return original_prog(kernel, pcb, *pcb._args)
+                return original_prog(kernel, pcb, *args)
 
             prog = wrapped_prog
 
-        # Create PCB with fresh VM
+        # Create PCB (VM only if requested; otherwise created on demand)
         pcb = PCB(
             pid=pid,
             state=State.NEW,
-            vm=VM(),
+            vm=VM() if needs_vm else None,
             prog=prog,
             name=name or f"proc{pid}"
         )
@@ -93,7 +156,10 @@ class Kernel:
         Execute one time slice (dispatch cycle).
 
         Steps:
-        1. Preempt current process if still RUNNING
+        0. Wake sleeping processes whose timer has expired, and age the
+           ready queue every AGING_INTERVAL cycles
+        1. Preempt current process if still RUNNING (unless nothing else
+           is ready, in which case it simply keeps the CPU)
         2. Get next READY process from scheduler
         3. Mark new process as RUNNING
         4. Execute one step of its program
@@ -101,23 +167,39 @@ class Kernel:
         """
         self.clock += 1
 
-        # Step 1: Preempt current process if still RUNNING
-        if self.running and self.running.state == State.RUNNING:
-            self.running.state = State.READY
-            self.sched.add(self.running)
-            self.running = None
-
-        # Step 2: Get next READY process
-        pcb = self.sched.next()
-
-        if not pcb:
-            # No process available, CPU idle
-            self.running = None
-            return
-
-        # Step 3: Mark as RUNNING
-        self.running = pcb
-        pcb.state = State.RUNNING
+        # Step 0: Wake due sleepers (only the heap top is ever inspected)
+        wait_heap = self.wait_heap
+        while wait_heap and wait_heap[0][0] <= self.clock:
+            _, _, sleeper = heapq.heappop(wait_heap)
+            if sleeper.state == State.WAITING:
+                sleeper.state = State.READY
+                self.sched.add(sleeper)
+
+        if self.clock % AGING_INTERVAL == 0:
+            self.sched.age()
+
+        pcb = self.running
+        if pcb and pcb.state == State.RUNNING and self.sched.empty():
+            # Fast path: no contention, keep running without a queue round-trip
+            pass
+        else:
+            # Step 1: Preempt current process if still RUNNING
+            if pcb and pcb.state == State.RUNNING:
+                pcb.state = State.READY
+                self.sched.add(pcb)
+                self.running = None
+
+            # Step 2: Get next READY process
+            pcb = self.sched.next()
+
+            if not pcb:
+                # No process available, CPU idle
+                self.running = None
+                return
+
+            # Step 3: Mark as RUNNING
+            self.running = pcb
+            pcb.state = State.RUNNING
 
         # Step 4: Execute one step of program
         try:
@@ -130,25 +212,26 @@ class Kernel:
 
         # Step 5: Handle state changes
         if pcb.state == State.TERMINATED:
-            # Remove from process table
-            del self.processes[pcb.pid]
+            # Remove from process table (kill_sys may already have done so)
+            self.processes.pop(pcb.pid, None)
             self.running = None
         elif pcb.state == State.WAITING:
             # Process blocked itself, remove from running
             self.running = None
             # Note: Process stays in self.processes but not in ready queue
+            # until woken (see sleep_until)
 
     def ps(self) -> List[Tuple[int, str, str]]:
         """
         Return process table (like Unix ps command).
 
         Returns:
-            List of (pid, name, state) tuples
+            List of (pid, name, state) tuples, ordered by PID
         """
-        result = []
-        for pid, pcb in sorted(self.processes.items()):
-            result.append((pid, pcb.name, pcb.state.name))
-        return result
+        # PIDs come from the strictly increasing next_pid and are never
+        # reused, and dict deletion preserves the order of the remaining
+        # keys, so insertion order is already PID order.
+        return [(pid, pcb.name, pcb.state.name) for pid, pcb in self.processes.items()]
 
     # ============= SYSTEM CALLS =============
 
@@ -166,6 +249,7 @@ class Kernel:
             return False
 
         pcb = self.processes[pid]
+        # Tombstone only: the scheduler and wait heap skip TERMINATED PCBs
         pcb.state = State.TERMINATED
 
         # Remove from process table
@@ -181,6 +265,9 @@ class Kernel:
         """
         List directory contents.
 
+        Kept as part of the lab's system call interface; the shell's ls
+        uses ls_sys_entries, which also reports entry types.
+
         Returns:
             List of filenames/directories in current working directory
         """
@@ -190,6 +277,23 @@ class Kernel:
             print(f"ls error: {e}")
             return []
 
+    def ls_sys_entries(self) -> List[Tuple[str, bool]]:
+        """
+        List directory contents along with their type.
+
+        Uses os.scandir so the directory flag usually comes from readdir
+        itself instead of a separate stat per entry.
+
+        Returns:
+            List of (name, is_dir) tuples for the current working directory
+        """
+        try:
+            with os.scandir(self.cwd) as it:
+                return [(entry.name, _entry_is_dir(entry)) for entry in it]
+        except Exception as e:
+            print(f"ls error: {e}")
+            return []
+
     def cd_sys(self, path: str) -> bool:
         """
         Change current working directory.
@@ -201,13 +305,33 @@ class Kernel:
             True if successful, False if path doesn't exist or isn't a directory
         """
         try:
-            # Resolve path relative to current directory
-            new_path = os.path.join(self.cwd, path)
-            new_path = os.path.abspath(new_path)
+            # Resolve path component-wise against the current directory
+            if os.altsep:
+                path = path.replace(os.altsep, os.sep)
+            drive, rest = os.path.splitdrive(path)
+            if drive or os.path.isabs(path):
+                # Absolute (or drive-qualified): restart from that root
+                root = (drive + os.sep) if drive else self.cwd_root
+                parts = []
+            else:
+                root = self.cwd_root
+                parts = list(self.cwd_parts)
+            for segment in rest.split(os.sep):
+                if segment in ("", "."):
+                    continue
+                if segment == "..":
+                    if parts:
+                        parts.pop()
+                else:
+                    parts.append(segment)
+            new_path = os.path.join(root, *parts)
 
             # Check if it's a valid directory
             if os.path.isdir(new_path):
+                self.cwd_root = root
+                self.cwd_parts = parts
                 self.cwd = new_path
+                self.cwd_name = parts[-1] if parts else root
                 return True
             else:
                 return False
@@ -251,6 +375,21 @@ class Kernel:
             print(f"cat error: {e}")
             return None
 
+    def sleep_until(self, pcb: PCB, when: int) -> None:
+        """
+        Block a process until the kernel clock reaches a given tick.
+
+        The process is not dispatched again until it is woken at the
+        start of the first dispatch cycle with clock >= when.
+
+        Args:
+            pcb: Process Control Block to block
+            when: Clock tick at which the process becomes READY again
+        """
+        pcb.state = State.WAITING
+        heapq.heappush(self.wait_heap, (when, self._wait_seq, pcb))
+        self._wait_seq += 1
+
     def exit_sys(self, pcb: PCB) -> None:
         """
         Mark current process as terminated (for exit command).
@@ -270,10 +409,13 @@ class Kernel:
             cycles: Number of dispatch cycles to execute
             verbose: Print execution trace
         """
-        if verbose:
-            print(f"{'=' * 60}")
-            print(f"Kernel Starting (max {cycles} cycles)")
-            print(f"{'=' * 60}\n")
+        if not verbose:
+            self._run_fast(cycles)
+            return
+
+        print(BAR)
+        print(f"Kernel Starting (max {cycles} cycles)")
+        print(BAR + "\n")
 
         for _ in range(cycles):
             prev_running = self.running
@@ -281,29 +423,37 @@ class Kernel:
             self.dispatch()
 
             # Log context switches
-            if verbose and prev_running != self.running:
+            if prev_running != self.running:
                 prev_str = f"P{prev_running.pid}({prev_running.name})" if prev_running else "IDLE"
                 curr_str = f"P{self.running.pid}({self.running.name})" if self.running else "IDLE"
                 print(f"[{self.clock:3d}] {prev_str:15s} → {curr_str:15s}")
 
             # Stop if no processes remain
             if not self.processes:
-                if verbose:
-                    print(f"\n{'=' * 60}")
-                    print(f"All processes completed at cycle {self.clock}")
-                    print(f"{'=' * 60}")
+                print("\n" + BAR)
+                print(f"All processes completed at cycle {self.clock}")
+                print(BAR)
                 break
 
-        if verbose and self.processes:
-            print(f"\n{'=' * 60}")
+        if self.processes:
+            print("\n" + BAR)
             print(f"Kernel stopped at cycle {self.clock}")
             print(f"Active processes: {len(self.processes)}")
-            print(f"{'=' * 60}")
+            print(BAR)
+
+    def _run_fast(self, cycles: int) -> None:
+        """Non-verbose run loop with hot attributes bound to locals."""
+        dispatch = self.dispatch
+        processes = self.processes  # Never rebound, only mutated
+        for _ in range(cycles):
+            dispatch()
+            if not processes:
+                break
 
     def print_ps(self) -> None:
         """Print formatted process table."""
         print("\nProcess Table:")
         print(f"{'PID':<6} {'Name':<15} {'State':<12}")
-        print("-" * 35)
+        print(PRINT_PS_RULE)
         for pid, name, state in self.ps():
             print(f"{pid:<6} {name:<15} {state:<12}")
\ No newline at end of file
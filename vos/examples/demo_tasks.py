@@ -2,6 +2,14 @@
 
 from vos.core.process import State
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to plain Python
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
 
 def idle_process(kernel, pcb, cycles: int):
     """
@@ -12,12 +20,13 @@ def idle_process(kernel, pcb, cycles: int):
         pcb: Process Control Block
         cycles: Number of cycles to run before terminating
     """
-    if not hasattr(pcb, 'count'):
-        pcb.count = 0
+    local = pcb.local
+    if not local:
+        local['count'] = 0
 
-    pcb.count += 1
+    local['count'] += 1
 
-    if pcb.count >= cycles:
+    if local['count'] >= cycles:
         print(f"  [P{pcb.pid}] Idle process completed {cycles} cycles")
         pcb.state = State.TERMINATED
 
@@ -31,16 +40,17 @@ def memory_touch_process(kernel, pcb, num_pages: int):
         pcb: Process Control Block
         num_pages: Number of pages to touch
     """
-    if not hasattr(pcb, 'page_count'):
-        pcb.page_count = 0
+    local = pcb.local
+    if not local:
+        local['page_count'] = 0
 
     # Touch a new page each cycle
-    page_address = pcb.page_count * 4096  # 4KB pages
-    pcb.vm.write_byte(page_address, pcb.page_count)
+    page_address = local['page_count'] * 4096  # 4KB pages
+    pcb.get_vm().write_byte(page_address, local['page_count'])
 
-    pcb.page_count += 1
+    local['page_count'] += 1
 
-    if pcb.page_count >= num_pages:
+    if local['page_count'] >= num_pages:
         print(f"  [P{pcb.pid}] Touched {num_pages} pages")
         pcb.state = State.TERMINATED
 
@@ -54,16 +64,25 @@ def counter_process(kernel, pcb, target: int = 10):
         pcb: Process Control Block
         target: Count to reach before terminating
     """
-    if not hasattr(pcb, 'count'):
-        pcb.count = 0
+    local = pcb.local
+    if not local:
+        local['count'] = 0
 
-    pcb.count += 1
+    local['count'] += 1
 
-    if pcb.count >= target:
+    if local['count'] >= target:
         print(f"  [P{pcb.pid}] Counter reached {target}")
         pcb.state = State.TERMINATED
 
 
+@njit(cache=True)
+def _burst(total):
+    """Inner arithmetic loop of cpu_burst_process (JIT-compiled if numba is available)."""
+    for i in range(100):
+        total += i
+    return total
+
+
 def cpu_burst_process(kernel, pcb):
     """
     CPU-bound process that performs computation.
@@ -72,52 +91,49 @@ def cpu_burst_process(kernel, pcb):
         kernel: Kernel instance
         pcb: Process Control Block
     """
-    if not hasattr(pcb, 'sum'):
-        pcb.sum = 0
-        pcb.iterations = 0
+    local = pcb.local
+    if not local:
+        local['sum'] = 0
+        local['iterations'] = 0
 
     # Simulate CPU-intensive work
-    for i in range(100):
-        pcb.sum += i
+    local['sum'] = _burst(local['sum'])
 
-    pcb.iterations += 1
+    local['iterations'] += 1
 
-    if pcb.iterations >= 20:
-        print(f"  [P{pcb.pid}] CPU burst completed, sum={pcb.sum}")
+    if local['iterations'] >= 20:
+        print(f"  [P{pcb.pid}] CPU burst completed, sum={local['sum']}")
         pcb.state = State.TERMINATED
 
 
 def io_simulation_process(kernel, pcb):
     """
-    Process that simulates I/O operations by going into WAITING state.
+    Process that simulates I/O operations by sleeping in the WAITING state.
 
     Args:
         kernel: Kernel instance
         pcb: Process Control Block
     """
-    if not hasattr(pcb, 'phase'):
-        pcb.phase = 'compute'
-        pcb.steps = 0
-
-    pcb.steps += 1
-
-    if pcb.phase == 'compute':
-        if pcb.steps >= 3:
-            # Simulate starting I/O
-            pcb.phase = 'waiting'
-            pcb.state = State.WAITING
-            pcb.io_complete_at = kernel.clock + 5
+    local = pcb.local
+    if not local:
+        local['phase'] = 'compute'
+        local['steps'] = 0
+
+    local['steps'] += 1
+
+    if local['phase'] == 'compute':
+        if local['steps'] >= 3:
+            # Simulate starting I/O; the kernel wakes us when it completes
+            local['phase'] = 'waiting'
+            kernel.sleep_until(pcb, kernel.clock + 5)
             print(f"  [P{pcb.pid}] Starting I/O operation")
 
-    elif pcb.phase == 'waiting':
-        # Check if I/O is complete
-        if kernel.clock >= pcb.io_complete_at:
-            pcb.phase = 'done'
-            pcb.state = State.READY
-            kernel.sched.add(pcb)
-            print(f"  [P{pcb.pid}] I/O operation completed")
+    elif local['phase'] == 'waiting':
+        # First step after being woken
+        local['phase'] = 'done'
+        print(f"  [P{pcb.pid}] I/O operation completed")
 
-    elif pcb.phase == 'done':
-        if pcb.steps >= 8:
+    elif local['phase'] == 'done':
+        if local['steps'] >= 8:
             print(f"  [P{pcb.pid}] Process completed")
             pcb.state = State.TERMINATED
\ No newline at end of file
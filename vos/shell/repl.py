@@ -1,6 +1,196 @@
 """shell/repl.py - Interactive shell process for VOS."""
 
 import os
+import sys
+
+from vos.core.sys import BAR
+
+try:
+    # Importing readline makes input() use line editing and history
+    import readline
+except ImportError:  # e.g. Windows without pyreadline3
+    readline = None
+
+HISTORY_FILE = os.path.expanduser("~/.vos_history")
+HISTORY_LENGTH = 1000
+
+# Output separators (BAR is shared with the kernel)
+SHELL_PS_RULE = "-" * 40  # Width of the shell's ps table
+
+HELP_TEXT = """
+Available commands:
+  ps              - List all processes
+  kill <pid>      - Terminate process
+  ls              - List directory contents
+  cd <path>       - Change directory
+  touch <file>    - Create/update file
+  cat <file>      - Display file contents
+  pwd             - Print working directory
+  shell           - Spawn nested shell
+  exit            - Exit current shell
+  test1           - Run idle process demo
+  test2           - Run memory touch demo
+
+"""
+
+
+def load_history():
+    """Load shell history from HISTORY_FILE, if readline is available."""
+    if readline is None:
+        return
+    readline.set_history_length(HISTORY_LENGTH)
+    try:
+        readline.read_history_file(HISTORY_FILE)
+    except OSError:
+        pass  # No history yet
+
+
+def save_history():
+    """Persist shell history to HISTORY_FILE, if readline is available."""
+    if readline is None:
+        return
+    try:
+        readline.write_history_file(HISTORY_FILE)
+    except OSError as e:
+        print(f"history error: {e}")
+
+
+# ============= COMMAND HANDLERS =============
+# Each handler takes (kernel, pcb, args) and returns True to exit the shell.
+
+def _cmd_help(kernel, pcb, args):
+    sys.stdout.write(HELP_TEXT)
+
+
+def _cmd_ps(kernel, pcb, args):
+    # Build the whole table and emit it with a single write
+    lines = ["", f"{'PID':<6} {'Name':<20} {'State':<12}", SHELL_PS_RULE]
+    lines.extend(f"{pid:<6} {name:<20} {state:<12}" for pid, name, state in kernel.ps())
+    lines.append("")
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _cmd_kill(kernel, pcb, args):
+    if not args:
+        print("Usage: kill <pid>")
+        return False
+    try:
+        target_pid = int(args[0])
+    except ValueError:
+        print("Invalid PID (must be an integer)")
+        return False
+
+    if target_pid == pcb.pid:
+        print(f"Warning: Killing current shell (PID {pcb.pid})")
+        kernel.kill_sys(target_pid)
+        return True
+    elif kernel.kill_sys(target_pid):
+        print(f"Process {target_pid} terminated")
+    else:
+        print(f"Process {target_pid} not found")
+    return False
+
+
+def _cmd_ls(kernel, pcb, args):
+    entries = kernel.ls_sys_entries()
+    if entries:
+        # Sort and display in columns, emitted with a single write
+        entries.sort()
+        lines = ["  " + (entry + "/" if is_dir else entry) for entry, is_dir in entries]
+        sys.stdout.write("\n".join(lines) + "\n")
+    else:
+        print("(empty directory)")
+
+
+def _cmd_cd(kernel, pcb, args):
+    if not args:
+        print("Usage: cd <path>")
+    else:
+        path = args[0]
+        if kernel.cd_sys(path):
+            print(f"Changed to: {kernel.cwd}")
+        else:
+            print(f"cd: {path}: No such directory")
+
+
+def _cmd_touch(kernel, pcb, args):
+    if not args:
+        print("Usage: touch <filename>")
+    else:
+        filename = args[0]
+        if kernel.touch_sys(filename):
+            print(f"Created/updated: {filename}")
+        else:
+            print(f"Failed to create: {filename}")
+
+
+def _cmd_cat(kernel, pcb, args):
+    if not args:
+        print("Usage: cat <filename>")
+    else:
+        filename = args[0]
+        content = kernel.cat_sys(filename)
+        if content is not None:
+            print(content)
+        else:
+            print(f"cat: {filename}: No such file or cannot read")
+
+
+def _cmd_pwd(kernel, pcb, args):
+    print(kernel.cwd)
+
+
+def _cmd_shell(kernel, pcb, args):
+    # Spawn nested shell
+    child_pid = kernel.spawn(shell_process, name=f"shell{kernel.next_pid}")
+    print(f"Spawned nested shell with PID {child_pid}")
+
+    # Get the child PCB
+    child_pcb = kernel.processes[child_pid]
+
+    # Directly call the shell process (nested execution)
+    # This blocks until the child shell exits
+    child_pcb.prog(kernel, child_pcb)
+
+    print(f"\nReturned to shell PID {pcb.pid}")
+
+
+def _cmd_exit(kernel, pcb, args):
+    print(f"Exiting shell (PID {pcb.pid})")
+    kernel.exit_sys(pcb)
+    return True
+
+
+def _cmd_test1(kernel, pcb, args):
+    from vos.examples.demo_tasks import idle_process
+
+    # Run idle process from Lab 1/2
+    pid = kernel.spawn(idle_process, 5, name="idle_test")
+    print(f"Spawned idle process with PID {pid} (will idle for 5 cycles)")
+
+
+def _cmd_test2(kernel, pcb, args):
+    from vos.examples.demo_tasks import memory_touch_process
+
+    # Run memory touch process from Lab 1/2
+    pid = kernel.spawn(memory_touch_process, 10, name="memtest", needs_vm=True)
+    print(f"Spawned memory touch process with PID {pid} (will access 10 pages)")
+
+
+COMMANDS = {
+    "help": _cmd_help,
+    "ps": _cmd_ps,
+    "kill": _cmd_kill,
+    "ls": _cmd_ls,
+    "cd": _cmd_cd,
+    "touch": _cmd_touch,
+    "cat": _cmd_cat,
+    "pwd": _cmd_pwd,
+    "shell": _cmd_shell,
+    "exit": _cmd_exit,
+    "test1": _cmd_test1,
+    "test2": _cmd_test2,
+}
 
 
 def shell_process(kernel, pcb):
@@ -18,23 +208,21 @@ def shell_process(kernel, pcb):
     - exit: exit current shell
     - test1, test2: run demo programs
 
+    Commands are looked up in the COMMANDS table.
+
     Args:
         kernel: Kernel instance
         pcb: This shell's Process Control Block
     """
-    from vos.examples.demo_tasks import idle_process, memory_touch_process
-
-    print(f"\n{'=' * 60}")
+    print("\n" + BAR)
     print(f"VOS Shell Started (PID {pcb.pid})")
     print(f"Type 'help' for available commands")
-    print(f"{'=' * 60}\n")
+    print(BAR + "\n")
 
     while True:
         try:
             # Display prompt with PID and current directory
-            cwd_display = os.path.basename(kernel.cwd) or kernel.cwd
-            prompt = f"vos[{pcb.pid}]:{cwd_display}> "
-            command_line = input(prompt).strip()
+            command_line = input(f"vos[{pcb.pid}]:{kernel.cwd_name}> ").strip()
 
             if not command_line:
                 continue
@@ -45,125 +233,14 @@ def shell_process(kernel, pcb):
             args = parts[1:]
 
             # Execute command
-            if cmd == "help":
-                print("\nAvailable commands:")
-                print("  ps              - List all processes")
-                print("  kill <pid>      - Terminate process")
-                print("  ls              - List directory contents")
-                print("  cd <path>       - Change directory")
-                print("  touch <file>    - Create/update file")
-                print("  cat <file>      - Display file contents")
-                print("  pwd             - Print working directory")
-                print("  shell           - Spawn nested shell")
-                print("  exit            - Exit current shell")
-                print("  test1           - Run idle process demo")
-                print("  test2           - Run memory touch demo")
-                print()
-
-            elif cmd == "ps":
-                print(f"\n{'PID':<6} {'Name':<20} {'State':<12}")
-                print("-" * 40)
-                for pid, name, state in kernel.ps():
-                    print(f"{pid:<6} {name:<20} {state:<12}")
-                print()
-
-            elif cmd == "kill":
-                if not args:
-                    print("Usage: kill <pid>")
-                else:
-                    try:
-                        target_pid = int(args[0])
-                        if target_pid == pcb.pid:
-                            print(f"Warning: Killing current shell (PID {pcb.pid})")
-                            kernel.kill_sys(target_pid)
-                            break
-                        elif kernel.kill_sys(target_pid):
-                            print(f"Process {target_pid} terminated")
-                        else:
-                            print(f"Process {target_pid} not found")
-                    except ValueError:
-                        print("Invalid PID (must be an integer)")
-
-            elif cmd == "ls":
-                entries = kernel.ls_sys()
-                if entries:
-                    # Sort and display in columns
-                    entries.sort()
-                    for entry in entries:
-                        full_path = os.path.join(kernel.cwd, entry)
-                        if os.path.isdir(full_path):
-                            print(f"  {entry}/")
-                        else:
-                            print(f"  {entry}")
-                else:
-                    print("(empty directory)")
-
-            elif cmd == "cd":
-                if not args:
-                    print("Usage: cd <path>")
-                else:
-                    path = args[0]
-                    if kernel.cd_sys(path):
-                        print(f"Changed to: {kernel.cwd}")
-                    else:
-                        print(f"cd: {path}: No such directory")
-
-            elif cmd == "touch":
-                if not args:
-                    print("Usage: touch <filename>")
-                else:
-                    filename = args[0]
-                    if kernel.touch_sys(filename):
-                        print(f"Created/updated: {filename}")
-                    else:
-                        print(f"Failed to create: {filename}")
-
-            elif cmd == "cat":
-                if not args:
-                    print("Usage: cat <filename>")
-                else:
-                    filename = args[0]
-                    content = kernel.cat_sys(filename)
-                    if content is not None:
-                        print(content)
-                    else:
-                        print(f"cat: {filename}: No such file or cannot read")
-
-            elif cmd == "pwd":
-                print(kernel.cwd)
-
-            elif cmd == "shell":
-                # Spawn nested shell
-                child_pid = kernel.spawn(shell_process, name=f"shell{kernel.next_pid}")
-                print(f"Spawned nested shell with PID {child_pid}")
-
-                # Get the child PCB
-                child_pcb = kernel.processes[child_pid]
-
-                # Directly call the shell process (nested execution)
-                # This blocks until the child shell exits
-                child_pcb.prog(kernel, child_pcb)
-
-                print(f"\nReturned to shell PID {pcb.pid}")
-
-            elif cmd == "exit":
-                print(f"Exiting shell (PID {pcb.pid})")
-                kernel.exit_sys(pcb)
-                break
-
-            elif cmd == "test1":
-                # Run idle process from Lab 1/2
-                pid = kernel.spawn(idle_process, 5, name="idle_test")
-                print(f"Spawned idle process with PID {pid} (will idle for 5 cycles)")
-
-            elif cmd == "test2":
-                # Run memory touch process from Lab 1/2
-                pid = kernel.spawn(memory_touch_process, 10, name="memtest")
-                print(f"Spawned memory touch process with PID {pid} (will access 10 pages)")
-
-            else:
+            handler = COMMANDS.get(cmd)
+            if handler is None:
                 print(f"Unknown command: {cmd}")
                 print("Type 'help' for available commands")
+                continue
+
+            if handler(kernel, pcb, args):
+                break
 
         except EOFError:
             # Ctrl+D pressed